@@ -7,6 +7,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import threading
+import time
 from typing import Optional
 
 try:
@@ -17,6 +22,34 @@ except ModuleNotFoundError as exc:
         "pymongo is not installed in the active venv. Run: pip install pymongo"
     ) from exc
 
+# Optional: motor provides the asyncio client used by getAsyncConnection().
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+except ModuleNotFoundError:
+    AsyncIOMotorClient = None
+
+logger = logging.getLogger(__name__)
+
+# A successful ping is trusted for this many seconds before getConnection() re-pings.
+_PING_TTL = 30.0
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+# Client/pool defaults; each can be overridden per instance or via environment.
+DEFAULT_MAX_POOL_SIZE = _env_int("FINDCARE_MONGO_MAX_POOL_SIZE", 50)
+DEFAULT_MIN_POOL_SIZE = _env_int("FINDCARE_MONGO_MIN_POOL_SIZE", 5)
+DEFAULT_SERVER_SELECTION_TIMEOUT_MS = _env_int("FINDCARE_MONGO_SERVER_SELECTION_TIMEOUT_MS", 2000)
+DEFAULT_CONNECT_TIMEOUT_MS = _env_int("FINDCARE_MONGO_CONNECT_TIMEOUT_MS", 2000)
+# None keeps pymongo's default (no socket timeout), so long-running batch reads
+# and writes are not cut off; set it for latency-bound API callers.
+DEFAULT_SOCKET_TIMEOUT_MS = _env_int("FINDCARE_MONGO_SOCKET_TIMEOUT_MS", None)
+# Wire compression is opt-in, e.g. "zstd" (needs the zstandard package) or "zlib".
+DEFAULT_COMPRESSORS = os.getenv("FINDCARE_MONGO_COMPRESSORS", "")
+
 
 class ChatHealthyMongoUtilities:
     """
@@ -24,18 +57,50 @@ class ChatHealthyMongoUtilities:
 
     Behavior:
     - Constructor creates and validates a MongoClient via ping
-    - get_connection() returns the existing client after ping validation
+    - getConnection() returns the existing client, re-validating via ping at most
+      once every _PING_TTL seconds
+    - getAsyncConnection() returns a lazily created motor AsyncIOMotorClient
+      with the same ping caching; FastAPI/ASGI handlers should use it so
+      queries are awaited instead of blocking the event loop. The sync client
+      remains for CLI/admin scripts and notebooks.
     - Raises exceptions if connection or ping fails
     - Automatically closes the client when the object is destroyed
     - Supports context-manager usage (with ...)
     """
 
-    def __init__(self, connection_string: str) -> MongoClient:
+    def __init__(
+        self,
+        connection_string: str,
+        *,
+        max_pool_size: int = DEFAULT_MAX_POOL_SIZE,
+        min_pool_size: int = DEFAULT_MIN_POOL_SIZE,
+        server_selection_timeout_ms: int = DEFAULT_SERVER_SELECTION_TIMEOUT_MS,
+        connect_timeout_ms: int = DEFAULT_CONNECT_TIMEOUT_MS,
+        socket_timeout_ms: Optional[int] = DEFAULT_SOCKET_TIMEOUT_MS,
+        compressors: str = DEFAULT_COMPRESSORS,
+    ) -> None:
         if not connection_string or not isinstance(connection_string, str):
             raise ValueError("A valid MongoDB connection string must be provided.")
 
         self._connection_string: str = connection_string
+        # Shared by the sync and async clients.
+        self._client_options = {
+            "maxPoolSize": max_pool_size,
+            "minPoolSize": min_pool_size,
+            "serverSelectionTimeoutMS": server_selection_timeout_ms,
+            "connectTimeoutMS": connect_timeout_ms,
+            "retryWrites": True,
+        }
+        if socket_timeout_ms is not None:
+            self._client_options["socketTimeoutMS"] = socket_timeout_ms
+        if compressors:
+            self._client_options["compressors"] = compressors
         self._client: Optional[MongoClient] = None
+        self._last_ping_ts: float = 0.0
+        self._ping_lock = threading.Lock()
+        self._async_client: Optional[AsyncIOMotorClient] = None
+        self._async_last_ping_ts: float = 0.0
+        self._async_ping_lock: Optional[asyncio.Lock] = None
 
         self._create_and_validate_client()
 
@@ -44,13 +109,14 @@ class ChatHealthyMongoUtilities:
     # ------------------------------------------------------------------
     def _create_and_validate_client(self) -> None:
         try:
-            client = MongoClient(self._connection_string)
+            client = MongoClient(self._connection_string, **self._client_options)
 
             # Lightweight health check
             client.admin.command("ping")
 
             self._client = client
-            print("MongoDB connection successfully established and validated.")
+            self._last_ping_ts = time.monotonic()
+            logger.info("MongoDB connection successfully established and validated.")
 
         except PyMongoError as e:
             raise ConnectionError(
@@ -61,31 +127,85 @@ class ChatHealthyMongoUtilities:
         if self._client is None:
             raise ConnectionError("MongoDB client is not initialized.")
 
-        try:
-            self._client.admin.command("ping")
-        except PyMongoError as e:
-            raise ConnectionError(
-                f"Existing MongoDB connection failed ping check: {e}"
-            ) from e
+        if time.monotonic() - self._last_ping_ts < _PING_TTL:
+            return
+
+        # Serialize re-pings so concurrent callers share one round-trip.
+        with self._ping_lock:
+            if time.monotonic() - self._last_ping_ts < _PING_TTL:
+                return
+            try:
+                self._client.admin.command("ping")
+            except PyMongoError as e:
+                raise ConnectionError(
+                    f"Existing MongoDB connection failed ping check: {e}"
+                ) from e
+            self._last_ping_ts = time.monotonic()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def getConnection(self) -> MongoClient:
         """
-        Returns the active MongoClient after validating it with ping.
+        Returns the active MongoClient, pinging it if the last successful
+        ping is older than _PING_TTL seconds.
         """
         self._validate_existing_client()
         return self._client
 
+    async def getAsyncConnection(self) -> AsyncIOMotorClient:
+        """
+        Returns an AsyncIOMotorClient for use inside async request handlers,
+        creating it on first use and pinging it at most once per _PING_TTL.
+
+        Example:
+            client = await DbUtil.getAsyncConnection()
+            db = client["findcare"]
+            count = await db["providers"].count_documents({"state": "CA"})
+            stats = await db.command("dbstats")
+        """
+        if AsyncIOMotorClient is None:
+            raise ModuleNotFoundError(
+                "motor is not installed in the active venv. Run: pip install motor"
+            )
+
+        if self._async_client is None:
+            self._async_client = AsyncIOMotorClient(
+                self._connection_string, **self._client_options
+            )
+            self._async_last_ping_ts = 0.0
+        if self._async_ping_lock is None:
+            self._async_ping_lock = asyncio.Lock()
+
+        if time.monotonic() - self._async_last_ping_ts < _PING_TTL:
+            return self._async_client
+
+        async with self._async_ping_lock:
+            if time.monotonic() - self._async_last_ping_ts >= _PING_TTL:
+                try:
+                    await self._async_client.admin.command("ping")
+                except PyMongoError as e:
+                    raise ConnectionError(
+                        f"Async MongoDB connection failed ping check: {e}"
+                    ) from e
+                self._async_last_ping_ts = time.monotonic()
+
+        return self._async_client
+
     def close(self) -> None:
         """
-        Explicitly closes the MongoDB client.
+        Explicitly closes the MongoDB clients (sync and, if created, async).
         """
+        if self._async_client is not None:
+            try:
+                self._async_client.close()
+            finally:
+                self._async_client = None
+
         if self._client is not None:
             try:
                 self._client.close()
-                print("MongoDB connection closed.")
+                logger.debug("MongoDB connection closed.")
             finally:
                 self._client = None
 
@@ -0,0 +1,1295 @@
+# =============================================================================
+# File: findcare_app.py
+# FindCare backend (FastAPI API layer + Gradio harness). Importable as a module so
+# uvicorn workers (`uvicorn findcare_app:app --workers N`) and the Gradio sidecar
+# can load the app; FindCareInterfaceCatalogue_PRIVACYFIX.ipynb drives it.
+# Author: Skip Snow
+# Co-Author: GPT-5
+# Copyright (c) 2025 Skip Snow. All rights reserved.
+# =============================================================================
+
+from __future__ import annotations
+
+import atexit, hashlib, os, re, time, html, logging, signal, socket, subprocess, sys, threading, webbrowser
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+import plotly.graph_objects as go
+import uvicorn
+from fastapi import FastAPI, UploadFile, File, Form, Request
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict
+
+# Optional: brotli-asgi compresses ~20% smaller than gzip at similar CPU cost and
+# falls back to gzip for clients that don't accept br.
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
+
+# Optional imports (best-effort)
+try:
+    from PIL import Image
+except Exception:
+    Image = None
+
+try:
+    import pytesseract
+except Exception:
+    pytesseract = None
+
+try:
+    import PyPDF2
+except Exception:
+    PyPDF2 = None
+
+import gradio as gr
+
+# Handler setup lives in logging_config.configure_logging (file + console, configured
+# once); a second basicConfig here would only risk duplicate handlers. Worker and
+# sidecar processes get FINDCARE_LOG_TO_FILE=0 and log to the console only; set it
+# too when launching `uvicorn findcare_app:app --workers N` by hand.
+from logging_config import configure_logging
+logger = configure_logging("findcare-backend")
+
+HOST = os.getenv("FINDCARE_HOST", "127.0.0.1")
+PORT = int(os.getenv("FINDCARE_PORT", "7860"))
+
+def _resolve_workers(raw: str) -> int:
+    # "auto" -> 2*N_CPU+1; anything else is an explicit worker count.
+    if raw.strip().lower() == "auto":
+        return (os.cpu_count() or 1) * 2 + 1
+    return max(1, int(raw))
+
+# WORKERS > 1 forks uvicorn workers, which re-import the app from APP_IMPORT
+# (resolved against APP_DIR, the directory holding this module).
+WORKERS = _resolve_workers(os.getenv("FINDCARE_WORKERS", "1"))
+# Sessions, provider notes and the provider-table cache live in process memory, so
+# with several workers each request sees whichever worker's copy it lands on (and
+# uvicorn's shared socket can't pin a session to one worker). Until that state moves
+# to a shared store, WORKERS > 1 is refused; FINDCARE_MULTI_WORKER_UNSAFE=1 allows it
+# for traffic that never touches that state (health checks, read-only load tests).
+MULTI_WORKER_UNSAFE = os.getenv("FINDCARE_MULTI_WORKER_UNSAFE") == "1"
+if WORKERS > 1:
+    if not MULTI_WORKER_UNSAFE:
+        raise RuntimeError(
+            f"FINDCARE_WORKERS={WORKERS} is not supported: session and provider-notes state is per-process. "
+            "Run a single worker, or set FINDCARE_MULTI_WORKER_UNSAFE=1 for stateless traffic only."
+        )
+    logger.warning(
+        "Running %d workers with per-process session/notes state: stateful /api/* calls will disagree between workers.",
+        WORKERS,
+    )
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_IMPORT = os.getenv("FINDCARE_APP_IMPORT", "findcare_app:app")
+# Internal port of the single Gradio process that API workers proxy UI_PATH to.
+GRADIO_SIDECAR_PORT = int(os.getenv("FINDCARE_GRADIO_PORT", "7861"))
+
+ALLOWED_ORIGINS = [
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+]
+
+# HTML pages/fragments live in code/templates (next to this module). Templates
+# are compiled once and kept (no reload checks); the bytecode cache persists compiled
+# templates across restarts.
+TEMPLATES_DIR = os.getenv("FINDCARE_TEMPLATES_DIR", os.path.join(APP_DIR, "templates"))
+TEMPLATES = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+DEFAULT_SUMMARY_INTERVAL_SEC = int(os.getenv("FINDCARE_SUMMARY_INTERVAL_SEC", "60"))
+APP_TONE = "austere"
+
+def utc_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+# (epoch second, formatted string); swapped as one tuple so readers never see a torn pair.
+_ts_cache: Tuple[int, str] = (0, "")
+
+def utc_iso_cached() -> str:
+    """Second-resolution utc_iso(), reformatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    cached = _ts_cache
+    if cached[0] != now:
+        cached = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+        _ts_cache = cached
+    return cached[1]
+
+def new_id(prefix: str) -> str:
+    # 6 random bytes -> the same 12 hex chars as uuid4().hex[:12], without a UUID object.
+    return f"{prefix}-{os.urandom(6).hex()}"
+
+
+# -----------------------------------------------------------------------------
+# 2) Mock provider data (replace with your real provider dataset)
+# -----------------------------------------------------------------------------
+
+@dataclass(slots=True, frozen=True)
+class Provider:
+    id: str
+    name: str
+    specialty: str
+    city: str
+    state: str
+    rating: float
+    accepts_insurance: Tuple[str, ...] = ()
+    distance: str = "—"
+
+MOCK_PROVIDERS: Tuple[Provider, ...] = (
+    Provider(
+        id="prov-0001",
+        name="Stanford Health Care – Cardiology",
+        specialty="Cardiology",
+        state="CA",
+        city="Palo Alto",
+        distance="2.3 miles",
+        rating=4.8,
+        accepts_insurance=("Anthem", "Blue Cross", "Kaiser"),
+    ),
+    Provider(
+        id="prov-0002",
+        name="UCLA Medical Center – Cardiology",
+        specialty="Cardiology",
+        state="CA",
+        city="Los Angeles",
+        distance="5.1 miles",
+        rating=4.9,
+        accepts_insurance=("Anthem", "Blue Cross", "UCLA Health"),
+    ),
+    Provider(
+        id="prov-0003",
+        name="Mayo Clinic – Primary Care",
+        specialty="Primary Care",
+        state="MN",
+        city="Rochester",
+        distance="—",
+        rating=4.7,
+        accepts_insurance=("Blue Cross", "Aetna"),
+    ),
+    Provider(
+        id="prov-0004",
+        name="Mass General – Endocrinology",
+        specialty="Endocrinology",
+        state="MA",
+        city="Boston",
+        distance="—",
+        rating=4.6,
+        accepts_insurance=("Anthem", "Harvard Pilgrim"),
+    ),
+)
+
+# Notes are the only user-editable column; they live beside the immutable records.
+PROVIDER_NOTES: Dict[str, str] = {}
+
+# Column-wise view of MOCK_PROVIDERS, built once: inverted indexes (value -> row
+# positions) for exact-match filters and a pre-lowercased specialty column for the
+# substring filter. Call index_providers() again if MOCK_PROVIDERS is replaced or rows
+# are added.
+_BY_ID: Dict[str, Provider] = {}
+_BY_STATE: Dict[str, set] = {}
+_BY_INSURANCE: Dict[str, set] = {}
+# The specialty column is stored categorically: the distinct lowercased values plus
+# one integer code per row, so a filter tests each distinct value once and then
+# selects rows with a vectorized lookup instead of a per-row Python loop.
+_SPECIALTY_CATS: np.ndarray = np.array([], dtype=str)
+_SPECIALTY_CODES: np.ndarray = np.array([], dtype=np.intp)
+
+def _categorize(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    cats, codes = np.unique(np.array(values, dtype=str), return_inverse=True)
+    return cats, codes.astype(np.intp)
+
+def _substring_filter(candidates: np.ndarray, cats: np.ndarray, codes: np.ndarray, needle: str) -> np.ndarray:
+    hits = np.char.find(cats, needle) >= 0
+    return candidates[hits[codes[candidates]]]
+
+def index_providers() -> None:
+    global _BY_ID, _BY_STATE, _BY_INSURANCE, _SPECIALTY_CATS, _SPECIALTY_CODES
+    by_state: Dict[str, set] = {}
+    by_insurance: Dict[str, set] = {}
+    for i, p in enumerate(MOCK_PROVIDERS):
+        by_state.setdefault(p.state.upper(), set()).add(i)
+        for ins in p.accepts_insurance:
+            by_insurance.setdefault(ins, set()).add(i)
+    _BY_ID = {p.id: p for p in MOCK_PROVIDERS}
+    _BY_STATE = by_state
+    _BY_INSURANCE = by_insurance
+    _SPECIALTY_CATS, _SPECIALTY_CODES = _categorize([p.specialty.lower() for p in MOCK_PROVIDERS])
+
+index_providers()
+
+def match_provider_ids(state: Optional[str]=None, specialty: Optional[str]=None, insurance: Optional[str]=None) -> List[int]:
+    """Row positions in MOCK_PROVIDERS matching all given filters, in corpus order."""
+    ids: Optional[set] = None
+    if state:
+        ids = _BY_STATE.get(state.strip().upper(), set())
+    if insurance:
+        ins_ids = _BY_INSURANCE.get(insurance.strip(), set())
+        ids = ins_ids if ids is None else ids & ins_ids
+    if ids is None:
+        candidates = np.arange(len(MOCK_PROVIDERS), dtype=np.intp)
+    else:
+        candidates = np.fromiter(sorted(ids), dtype=np.intp, count=len(ids))
+    if specialty:
+        candidates = _substring_filter(candidates, _SPECIALTY_CATS, _SPECIALTY_CODES, specialty.strip().lower())
+    return candidates.tolist()
+
+def search_providers(state: Optional[str]=None, specialty: Optional[str]=None, insurance: Optional[str]=None, limit: int=50) -> Sequence[Provider]:
+    limit = max(1,int(limit))
+    if not (state or specialty or insurance):
+        # Nothing narrows the corpus: slice the immutable tuple directly (a full-length
+        # slice returns the tuple itself) instead of materializing an id list.
+        return MOCK_PROVIDERS[:limit]
+    ids = match_provider_ids(state=state, specialty=specialty, insurance=insurance)
+    return [MOCK_PROVIDERS[i] for i in ids[:limit]]
+
+
+# -----------------------------------------------------------------------------
+# 3) US states map data (50 clickable regions)
+# -----------------------------------------------------------------------------
+
+US_STATES: Tuple[Tuple[str, str], ...] = (
+    ("AL","Alabama"),("AK","Alaska"),("AZ","Arizona"),("AR","Arkansas"),("CA","California"),
+    ("CO","Colorado"),("CT","Connecticut"),("DE","Delaware"),("FL","Florida"),("GA","Georgia"),
+    ("HI","Hawaii"),("ID","Idaho"),("IL","Illinois"),("IN","Indiana"),("IA","Iowa"),
+    ("KS","Kansas"),("KY","Kentucky"),("LA","Louisiana"),("ME","Maine"),("MD","Maryland"),
+    ("MA","Massachusetts"),("MI","Michigan"),("MN","Minnesota"),("MS","Mississippi"),("MO","Missouri"),
+    ("MT","Montana"),("NE","Nebraska"),("NV","Nevada"),("NH","New Hampshire"),("NJ","New Jersey"),
+    ("NM","New Mexico"),("NY","New York"),("NC","North Carolina"),("ND","North Dakota"),("OH","Ohio"),
+    ("OK","Oklahoma"),("OR","Oregon"),("PA","Pennsylvania"),("RI","Rhode Island"),("SC","South Carolina"),
+    ("SD","South Dakota"),("TN","Tennessee"),("TX","Texas"),("UT","Utah"),("VT","Vermont"),
+    ("VA","Virginia"),("WA","Washington"),("WV","West Virginia"),("WI","Wisconsin"),("WY","Wyoming"),
+)
+
+def provider_count_by_state(state_code: str) -> int:
+    return len(_BY_STATE.get(state_code, ()))
+
+def build_us_states_map(selected: Optional[str]=None) -> Dict[str, Any]:
+    regions = []
+    for code, name in US_STATES:
+        regions.append({
+            "id": code,
+            "name": name,
+            "displayName": name,
+            "tooltip": f"Click to view {name} providers",
+            "color": "#3b82f6" if selected and selected.upper()==code else "#94a3b8",
+            "data": {"providerCount": provider_count_by_state(code)}
+        })
+    return {
+        "contentType": "map",
+        "mapData": {
+            "type": "us-states",
+            "regions": regions,
+            "interactionMode": "select-state",
+            "selectedRegion": selected.upper() if selected else None
+        }
+    }
+
+
+# -----------------------------------------------------------------------------
+# 4) Sanitization + file extraction helpers (best-effort OCR/PDF)
+# -----------------------------------------------------------------------------
+
+# Escaped open/close forms of the allowed tags, restored in a single pass.
+_ALLOWED_TAG_RE = re.compile(r"&lt;(/?)(b|strong|i|em|br|p|ul|ol|li|code|pre)&gt;")
+
+def sanitize_html_allow_basic(markup: str) -> str:
+    if markup is None:
+        return ""
+    escaped = html.escape(markup)
+    return _ALLOWED_TAG_RE.sub(r"<\1\2>", escaped)
+
+async def extract_text_from_upload(file: UploadFile) -> str:
+    filename = file.filename or "uploaded_file"
+    ctype = (file.content_type or "").lower()
+    try:
+        raw = await file.read()
+    except Exception as e:
+        return f"[{filename}] (error reading file: {e})"
+
+    if ctype.startswith("image/") and Image is not None and pytesseract is not None:
+        try:
+            from io import BytesIO
+            img = Image.open(BytesIO(raw))
+            text = (pytesseract.image_to_string(img) or "").strip()
+            return f"[{filename} OCR]\n{text}\n" if text else f"[{filename}] (OCR produced no text)"
+        except Exception as e:
+            return f"[{filename}] (OCR failed: {e})"
+
+    if ctype == "application/pdf" and PyPDF2 is not None:
+        try:
+            from io import BytesIO
+            reader = PyPDF2.PdfReader(BytesIO(raw))
+            pages = [(p.extract_text() or "") for p in reader.pages]
+            text = "\n".join(pages).strip()
+            return f"[{filename} PDF]\n{text}\n" if text else f"[{filename}] (PDF extraction produced no text)"
+        except Exception as e:
+            return f"[{filename}] (PDF extraction failed: {e})"
+
+    return f"[{filename}] (uploaded, contentType={ctype}, size={len(raw)} bytes)"
+
+
+# -----------------------------------------------------------------------------
+# 5) In-memory session store (replace with Redis/Mongo in production)
+# -----------------------------------------------------------------------------
+
+@dataclass
+class ChatMessage:
+    id: str
+    role: str
+    content: str
+    timestamp: str
+
+@dataclass
+class SessionState:
+    sessionId: str
+    createdAt: str
+    selectedState: Optional[str] = None
+    messages: List[ChatMessage] = None
+    summary: str = ""
+    lastSummaryAt: Optional[str] = None
+
+SESSIONS: Dict[str, SessionState] = {}
+
+def get_or_create_session(session_id: Optional[str]) -> SessionState:
+    sid = (session_id or "").strip() or new_id("session")
+    if sid not in SESSIONS:
+        SESSIONS[sid] = SessionState(sessionId=sid, createdAt=utc_iso(), selectedState=None, messages=[])
+    return SESSIONS[sid]
+
+def append_message(session: SessionState, role: str, content: str) -> ChatMessage:
+    msg = ChatMessage(id=new_id("msg"), role=role, content=content, timestamp=utc_iso())
+    session.messages.append(msg)
+    return msg
+
+def to_history_payload(session: SessionState, limit: Optional[int]=None, offset: int=0) -> Dict[str, Any]:
+    msgs = session.messages[offset:]
+    if limit is not None:
+        msgs = msgs[:int(limit)]
+    return {"messages":[asdict(m) for m in msgs], "total": len(session.messages), "hasMore": False}
+
+
+# -----------------------------------------------------------------------------
+# 6) FastAPI app + CORS + optional Gradio mount
+# -----------------------------------------------------------------------------
+
+# NOTE:
+# - This Gradio UI is for local smoke-testing and for implementing the
+#   UX "frames" described in the Find Care Interface Catalogue.
+# - The React frontend should call the REST APIs (/api/*). This UI is
+#   a reference implementation and a convenient manual test harness.
+
+UI_PATH = "/gradio"
+
+# ---------- helpers (uses MOCK_PROVIDERS and US_STATES above) ----------
+
+def _state_counts_from_mock(providers: Sequence[Provider]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for p in providers:
+        st = p.state.upper().strip()
+        if not st:
+            continue
+        counts[st] = counts.get(st, 0) + 1
+    # ensure all 50 exist
+    for abbr, _name in US_STATES:
+        counts.setdefault(abbr, 0)
+    return counts
+
+# Providers are immutable, so one figure per selected state is built once and
+# shared; callers must not mutate the returned figure.
+@lru_cache(maxsize=64)
+def build_us_map(selected_state: Optional[str] = None) -> go.Figure:
+    counts = _state_counts_from_mock(MOCK_PROVIDERS)
+    locations = [abbr for abbr, _ in US_STATES]
+    z = [counts.get(abbr, 0) for abbr in locations]
+    hover = [f"{abbr}: {counts.get(abbr,0)} providers" for abbr in locations]
+
+    fig = go.Figure(
+        data=go.Choropleth(
+            locations=locations,
+            z=z,
+            locationmode="USA-states",
+            text=hover,
+            hoverinfo="text",
+            marker_line_color="white",
+        )
+    )
+    fig.update_layout(
+        geo_scope="usa",
+        margin=dict(l=0, r=0, t=0, b=0),
+        height=420,
+    )
+
+    # Highlight selection via a simple annotation (Plotly choropleth selection
+    # is not consistently clickable via Gradio, so we show selection explicitly).
+    if selected_state:
+        fig.add_annotation(
+            text=f"Selected: {selected_state}",
+            xref="paper", yref="paper",
+            x=0.01, y=0.02,
+            showarrow=False,
+        )
+    return fig
+
+def filter_providers(state: Optional[str], specialty: Optional[str]) -> Sequence[Provider]:
+    state = (state or "").strip().upper() or None
+    specialty = (specialty or "").strip() or None
+    if not (state or specialty):
+        return MOCK_PROVIDERS
+    return [MOCK_PROVIDERS[i] for i in match_provider_ids(state=state, specialty=specialty)]
+
+def providers_to_table_rows(providers: Sequence[Provider]) -> List[List[Any]]:
+    rows = []
+    for p in providers:
+        rows.append([
+            p.name,
+            p.specialty,
+            p.city,
+            p.state,
+            p.distance,
+            p.rating,
+        ])
+    return rows
+
+# Initial Graphic Content payload, computed once and handed to every UI session.
+INITIAL_STATE = "CA"
+INITIAL_SPECIALTY = "Cardiology"
+INITIAL_MAP = build_us_map(INITIAL_STATE)
+INITIAL_TABLE_ROWS = providers_to_table_rows(filter_providers(INITIAL_STATE, INITIAL_SPECIALTY))
+
+# ---------- FastAPI app ----------
+# orjson for every JSON body; handlers return ORJSONResponse directly so FastAPI
+# also skips its jsonable_encoder pass.
+app = FastAPI(
+    title="FindCare Gradio Backend (FastAPI API Layer)",
+    version="1.0",
+    default_response_class=ORJSONResponse,
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Compress provider tables and Gradio assets; small bodies aren't worth the CPU.
+# Levels are kept low-to-mid: the top levels cost far more CPU for a few percent.
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# ---------- Gradio "frames" UI ----------
+CSS = """
+:root { --fc-border:#d0d7de; --fc-bg:#ffffff; --fc-header:#4682b4; --fc-text:#111; }
+.fc-frame { border:1px solid var(--fc-border); border-radius:14px; padding:12px; background:var(--fc-bg); }
+.fc-header { border:1px solid var(--fc-border); border-radius:14px; padding:10px 12px; background:var(--fc-header); color:white; }
+.fc-header a { color:white; text-decoration:none; font-size:13px; }
+.fc-header a:hover { text-decoration:underline; }
+.fc-logo { font-weight:700; font-size:14px; letter-spacing:0.3px; }
+.fc-subtle { font-size:12px; opacity:0.92; }
+"""
+
+def _build_header_html() -> str:
+    # Links are server-resolved pages (served by FastAPI routes below)
+    return TEMPLATES.get_template("fc_header.html").render()
+
+with gr.Blocks(css=CSS, title="FindCare") as demo:
+    # Frame 1: Header
+    gr.HTML(_build_header_html())
+
+    with gr.Row():
+        # Column 1 (Geometric support frame) contains functional frames 2 & 3
+        with gr.Column(scale=1, min_width=320):
+            with gr.Group(elem_classes=["fc-frame"]):
+                gr.Markdown("### Session Summary", elem_id="fc-session-summary-title")
+                session_summary = gr.Textbox(
+                    label="",
+                    value="(Summary will refresh periodically.)",
+                    lines=6,
+                    interactive=False,
+                    show_copy_button=True,
+                )
+                refresh_summary = gr.Button("Refresh summary", size="sm")
+
+            with gr.Group(elem_classes=["fc-frame"]):
+                gr.Markdown("### Button Manager")
+                insurance_btn = gr.Button("Insurance Portal", variant="secondary")
+                emr_btn = gr.Button("EMR Access (Epic)", variant="secondary")
+                session_info_btn = gr.Button("Session Information (PDF)", variant="secondary")
+                choose_model = gr.Dropdown(
+                    label="Choose Model",
+                    choices=["gpt-4.1", "gpt-4o", "gpt-4.1-mini"],
+                    value="gpt-4.1-mini",
+                )
+                button_status = gr.Markdown("")
+
+        # Column 2 (Geometric support frame) - Graphic content (Frame 5)
+        with gr.Column(scale=2, min_width=520):
+            with gr.Group(elem_classes=["fc-frame"]):
+                gr.Markdown("### Graphic Content")
+                selected_state = gr.Dropdown(
+                    label="State (clickable map is provided via the browser/React; this dropdown is a local harness)",
+                    choices=[abbr for abbr, _ in US_STATES],
+                    value=INITIAL_STATE,
+                )
+                specialty = gr.Dropdown(
+                    label="Specialty",
+                    choices=sorted({p.specialty for p in MOCK_PROVIDERS}),
+                    value=INITIAL_SPECIALTY,
+                )
+                us_map = gr.Plot(value=INITIAL_MAP, label="US Map (50 states)")
+                provider_table = gr.Dataframe(
+                    headers=["Name", "Specialty", "City", "State", "Distance", "Rating"],
+                    value=INITIAL_TABLE_ROWS,
+                    interactive=True,   # V1: allow editing allowed cells (we allow all for harness)
+                    wrap=True,
+                    max_height=240,
+                    label="Providers (scrollable)",
+                )
+
+        # Column 3 (Geometric support frame) - Result box / diagnostics
+        with gr.Column(scale=1, min_width=320):
+            with gr.Group(elem_classes=["fc-frame"]):
+                gr.Markdown("### Result Box")
+                results_box = gr.Textbox(
+                    label="",
+                    value="(Server will return color-attributed results array for the browser client.)",
+                    lines=14,
+                    interactive=False,
+                    show_copy_button=True,
+                )
+
+    # Frame 4: Scrollable Output (Chat)
+    with gr.Row():
+        with gr.Column(scale=1):
+            with gr.Group(elem_classes=["fc-frame"]):
+                gr.Markdown("### Scrollable Output")
+                chat = gr.Chatbot(height=320, label="", show_copy_button=True)
+
+    # Frame 6: Prompt
+    with gr.Row():
+        with gr.Column(scale=1):
+            with gr.Group(elem_classes=["fc-frame"]):
+                gr.Markdown("### Prompt")
+                prompt = gr.Textbox(
+                    label="",
+                    placeholder="Ask about healthcare providers… (sent only on Send / Enter)",
+                    lines=4,
+                )
+                files = gr.File(
+                    label="Upload files (images/PDFs)",
+                    file_count="multiple",
+                )
+                send = gr.Button("Send ➤", variant="primary")
+                prompt_status = gr.Markdown("", elem_id="fc-prompt-status")
+
+    # --- UI wiring (local harness) ---
+    def ui_update_graphic_content(state: str, spec: str):
+        fig = build_us_map(state)
+        providers = filter_providers(state, spec)
+        table = providers_to_table_rows(providers)
+        return fig, table
+
+    selected_state.change(ui_update_graphic_content, inputs=[selected_state, specialty], outputs=[us_map, provider_table])
+    specialty.change(ui_update_graphic_content, inputs=[selected_state, specialty], outputs=[us_map, provider_table])
+
+    def ui_handle_buttons(which: str):
+        # This harness calls the same server-side logic as /api/button-manager (below),
+        # but keeps the "flow" inside the button manager.
+        if which == "insurance":
+            return "Insurance Portal: will request credentials form from server (V1 supports Kaiser/UCLA/Anthem when available)."
+        if which == "emr":
+            return "EMR Access: will request credentials form from server (V1 supports Epic only when available)."
+        if which == "session-info":
+            return "Session Information: server will return a PDF download link (prototype placeholder)."
+        return ""
+
+    insurance_btn.click(lambda: ui_handle_buttons("insurance"), outputs=[button_status])
+    emr_btn.click(lambda: ui_handle_buttons("emr"), outputs=[button_status])
+    session_info_btn.click(lambda: ui_handle_buttons("session-info"), outputs=[button_status])
+
+    def ui_refresh_summary():
+        # Local placeholder; the real summary comes from /api/session-summary
+        return "Session Summary (placeholder): user is exploring providers and asking questions."
+
+    refresh_summary.click(ui_refresh_summary, outputs=[session_summary])
+
+    def ui_send_message(p: str, history: List[Tuple[str, str]]):
+        p = (p or "").strip()
+        if not p:
+            return history, "", "Please enter a prompt."
+        history = history or []
+        # Local harness echo; real client uses /api/prompt + /api/scrollable-output
+        history.append((p, "Thanks — backend received your prompt (local harness response)."))
+        return history, "", ""
+
+    send.click(ui_send_message, inputs=[prompt, chat], outputs=[chat, prompt, prompt_status])
+    prompt.submit(ui_send_message, inputs=[prompt, chat], outputs=[chat, prompt, prompt_status])
+
+# Mount Gradio under a subpath so /health and REST APIs remain reachable.
+# The demo keeps its queue/session state in-process, so with several API workers
+# it runs once as a sidecar (see start_backend) and every worker proxies UI_PATH
+# to it; mounting it per worker would give each its own inconsistent copy.
+GRADIO_MOUNTED = WORKERS == 1
+if GRADIO_MOUNTED:
+    app = gr.mount_gradio_app(app, demo, path=UI_PATH)
+else:
+    import httpx
+    from fastapi.responses import StreamingResponse
+    from starlette.background import BackgroundTask
+
+    # Hop-by-hop headers are per connection; accept-encoding is dropped so the
+    # sidecar answers uncompressed and this app's compression middleware applies once.
+    # Host is kept: Gradio builds the root URL it embeds in the page from it.
+    _PROXY_SKIP_REQUEST_HEADERS = {"connection", "keep-alive", "upgrade", "accept-encoding"}
+    _PROXY_SKIP_RESPONSE_HEADERS = {"connection", "keep-alive", "transfer-encoding", "upgrade"}
+
+    _gradio_client = httpx.AsyncClient(base_url=f"http://127.0.0.1:{GRADIO_SIDECAR_PORT}", timeout=None)
+    app.add_event_handler("shutdown", _gradio_client.aclose)
+    # httpx logs every request at INFO, which would repeat uvicorn's access line for
+    # each proxied asset and SSE call.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    @app.api_route(UI_PATH, methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "PATCH"])
+    @app.api_route(UI_PATH + "/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "PATCH"])
+    async def gradio_proxy(request: Request, path: str = "") -> Response:
+        headers = [(k, v) for k, v in request.headers.items() if k.lower() not in _PROXY_SKIP_REQUEST_HEADERS]
+        # Tell Gradio the public host/scheme (unless a proxy in front already did) so
+        # its links point back here rather than at the sidecar's 127.0.0.1 port.
+        if "x-forwarded-host" not in request.headers:
+            headers.append(("x-forwarded-host", request.headers.get("host", f"{HOST}:{PORT}")))
+        if "x-forwarded-proto" not in request.headers:
+            headers.append(("x-forwarded-proto", request.url.scheme))
+        upstream = _gradio_client.build_request(
+            request.method,
+            f"{UI_PATH}/{path}",
+            params=request.query_params,
+            headers=headers,
+            content=request.stream(),
+        )
+        try:
+            resp = await _gradio_client.send(upstream, stream=True)
+        except httpx.TransportError as e:
+            logger.warning("Gradio sidecar unreachable on port %d: %s", GRADIO_SIDECAR_PORT, e)
+            return ORJSONResponse(status_code=502, content={"status":"error","message":"Gradio UI unavailable"})
+        # Stream chunks through as they arrive (Gradio's queue uses SSE).
+        return StreamingResponse(
+            resp.aiter_raw(),
+            status_code=resp.status_code,
+            headers={k: v for k, v in resp.headers.items() if k.lower() not in _PROXY_SKIP_RESPONSE_HEADERS},
+            background=BackgroundTask(resp.aclose),
+        )
+
+    logger.info("Gradio UI proxied to sidecar on port %d (workers=%d).", GRADIO_SIDECAR_PORT, WORKERS)
+
+
+# -----------------------------------------------------------------------------
+# 7) API: `/api/header`
+# -----------------------------------------------------------------------------
+
+# Request bodies are typed Pydantic models (validated by pydantic-core). Keep the
+# API's {"status":"error"} 400 envelope for bodies that fail validation, naming the
+# offending field (e.g. "Invalid link") instead of FastAPI's default 422. Only these
+# JSON endpoints get the envelope; other routes (the multipart /api/prompt) keep the 422.
+_JSON_API_PATHS = frozenset({
+    "/api/header",
+    "/api/session-summary",
+    "/api/button-manager",
+    "/api/scrollable-output",
+    "/api/graphic-content",
+})
+
+@app.exception_handler(RequestValidationError)
+async def request_validation_error_handler(request: Request, exc: RequestValidationError) -> Response:
+    if request.url.path not in _JSON_API_PATHS:
+        return await request_validation_exception_handler(request, exc)
+    errors = exc.errors()
+    loc = errors[0].get("loc", ()) if errors else ()
+    # Last named segment: a malformed JSON body reports ("body", <offset>).
+    field = next((part for part in reversed(loc) if isinstance(part, str)), "request")
+    # No pydantic details: they echo the submitted input (button-manager credentials).
+    return ORJSONResponse(status_code=400, content={"status":"error","message": f"Invalid {field}"})
+
+class HeaderPayload(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    link: Literal["secret-sause","about","contact","privacy-policy"]
+
+@app.post("/api/header")
+async def header_api(payload: HeaderPayload) -> ORJSONResponse:
+    link = payload.link
+
+    if link == "contact":
+        return ORJSONResponse(content={
+            "type": "contact-info",
+            "contactName": "Skip Snow",
+            "contactEmail": "skip.snow@gmail.com",
+            "mailtoSubject": "FindCare Inquiry",
+            "fallbackMessage": "Please email Skip Snow at skip.snow@gmail.com"
+        })
+
+    if link == "secret-sause":
+        content = sanitize_html_allow_basic(
+            "<p><strong>Secret Sause</strong></p>"
+            "<p>Tools/processes used to fuel FindCare: Gradio + FastAPI backend, provider/specialty data, and LLM orchestration.</p>"
+        )
+        return ORJSONResponse(content={"type":"page-content","content":content})
+
+    if link == "about":
+        content = sanitize_html_allow_basic(
+            "<p><strong>About FindCare</strong></p>"
+            "<p>FindCare helps users ask domain-specific questions and locate providers using existing provider & specialty data.</p>"
+        )
+        return ORJSONResponse(content={"type":"page-content","content":content})
+
+    # privacy-policy
+    content = sanitize_html_allow_basic(
+        "<p><strong>Privacy Policy (MVP)</strong></p>"
+        "<p>Find care stores your deidentified data for training puproses.</P>"
+        "<P>Find care is Not a covered entity under HIPAA but does act as a HIiPPA Business Paartner with your data and does not disclose any HIPAA data to anyh of its staff or outsideparites. </P>" 
+        "<P>Find carenor does it retain any identtified HIPAA information at all.<p>"
+        "<P>Find care does not log useers in or retain any end user information. FindCare does not store passwords or any facts about identified users.</P>" 
+        "<P>Identified PHI may be accessed only with explicit user action and is not retained by default.</p>"
+    )
+    return ORJSONResponse(content={"type":"page-content","content":content})
+
+
+# -----------------------------------------------------------------------------
+# 8) API: `/api/session-summary` (wipe & replace)
+# -----------------------------------------------------------------------------
+
+def simple_summary(messages: List[ChatMessage], max_chars: int=800) -> str:
+    if not messages:
+        return "No conversation yet."
+    last_user = next((m for m in reversed(messages) if m.role=="user"), None)
+    last_assistant = next((m for m in reversed(messages) if m.role=="assistant"), None)
+    parts = [f"Messages: {len(messages)}"]
+    if last_user:
+        parts.append(f"Latest question: {last_user.content[:200]}")
+    if last_assistant:
+        parts.append(f"Latest answer: {last_assistant.content[:200]}")
+    out = " | ".join(parts)
+    return out[:max_chars]
+
+class SessionSummaryPayload(BaseModel):
+    # report-error logs whatever the client sent, so unknown fields are kept.
+    model_config = ConfigDict(extra="allow")
+    action: Optional[str] = None
+    sessionId: Optional[str] = None
+    copyMethod: Any = None
+    timestamp: Any = None
+
+@app.post("/api/session-summary")
+async def session_summary_api(payload: SessionSummaryPayload) -> ORJSONResponse:
+    action = payload.action
+    session = get_or_create_session(payload.sessionId)
+
+    if action == "get-summary":
+        session.summary = simple_summary(session.messages)
+        session.lastSummaryAt = utc_iso_cached()
+        return ORJSONResponse(content={"summary": session.summary, "timestamp": session.lastSummaryAt, "nextUpdateIn": DEFAULT_SUMMARY_INTERVAL_SEC})
+
+    if action == "copy-summary":
+        logger.info("Summary copied | session=%s | method=%s | ts=%s", session.sessionId, payload.copyMethod, payload.timestamp)
+        return ORJSONResponse(content={"logged": True})
+
+    if action == "report-error":
+        logger.warning("Summary overflow | session=%s | payload=%s", session.sessionId, payload.model_dump())
+        return ORJSONResponse(content={"acknowledged": True, "fallbackAction": "truncate", "fallbackContent": (session.summary or "")[:400]})
+
+    return ORJSONResponse(status_code=400, content={"status":"error","message":"Invalid action"})
+
+
+# -----------------------------------------------------------------------------
+# 9) API: `/api/button-manager` (forms + stub integrations; never store passwords)
+# -----------------------------------------------------------------------------
+
+class ButtonManagerPayload(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    action: Optional[str] = None
+    step: Optional[str] = None
+    sessionId: Optional[str] = None
+    credentials: Optional[Dict[str, Any]] = None
+
+@app.post("/api/button-manager")
+async def button_manager_api(payload: ButtonManagerPayload) -> ORJSONResponse:
+    action = payload.action
+    step = payload.step
+    _ = get_or_create_session(payload.sessionId)
+
+    if action not in {"insurance-portal","emr-access"}:
+        return ORJSONResponse(status_code=400, content={"status":"error","message":"Invalid action"})
+
+    if step == "request-form":
+        title = "Insurance Portal Access" if action=="insurance-portal" else "EMR Access"
+        return ORJSONResponse(content={
+            "formType": "popup",
+            "formTitle": title,
+            "formContent": {
+                "agreement": {"text":"We will access your medical data but not retain identified information.","checkboxLabel":"I agree to the terms above","required": True},
+                "fields": [
+                    {"name":"username","label":"Portal Username","type":"text","required": True,"placeholder":"username"},
+                    {"name":"password","label":"Portal Password","type":"password","required": True,"placeholder":"password"},
+                    {"name":"portalUrl","label":"Portal URL or App Name","type":"url","required": True,"placeholder":"https://... or 'Epic MyChart'"},
+                ],
+                "submitButton":"Connect",
+                "cancelButton":"Cancel"
+            }
+        })
+
+    if step == "submit-credentials":
+        creds = payload.credentials or {}
+        if not creds.get("agreementAccepted", False):
+            return ORJSONResponse(status_code=400, content={"status":"error","errorCode":"CONNECTION_FAILED","message":"Agreement must be accepted to proceed.","retryAllowed": True})
+
+        portal = creds.get("portalUrl","")
+        username = creds.get("username","")
+
+        if action=="insurance-portal":
+            supported = ["Kaiser","UCLA","Anthem"]
+            if not any(s.lower() in portal.lower() for s in supported):
+                return ORJSONResponse(status_code=400, content={"status":"error","errorCode":"UNSUPPORTED_PORTAL","message":"Unsupported insurance portal for V1.","retryAllowed": False,"supportedPortals": supported})
+
+        if action=="emr-access":
+            if "epic" not in portal.lower():
+                return ORJSONResponse(status_code=400, content={"status":"error","errorCode":"UNSUPPORTED_PORTAL","message":"Unsupported EMR for V1. Only Epic is supported.","retryAllowed": False,"supportedPortals": ["Epic"]})
+
+        return ORJSONResponse(content={"status":"success","message": f"Connected (stub) as {username or '[user]'}","dataRetrieved":{"summary":"Retrieved sample de-identified context (stub).","recordCount":3,"lastUpdated": utc_iso_cached()}})
+
+    return ORJSONResponse(status_code=400, content={"status":"error","message":"Invalid step"})
+
+
+# -----------------------------------------------------------------------------
+# 10) API: `/api/scrollable-output`
+# -----------------------------------------------------------------------------
+
+class ScrollableOutputPayload(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    action: Optional[str] = None
+    sessionId: Optional[str] = None
+    message: Optional[Dict[str, Any]] = None
+    limit: Optional[int] = None
+    offset: Optional[int] = None
+    messageIds: Any = None
+    copyType: Any = None
+    timestamp: Any = None
+
+@app.post("/api/scrollable-output")
+async def scrollable_output_api(payload: ScrollableOutputPayload) -> ORJSONResponse:
+    action = payload.action
+    session = get_or_create_session(payload.sessionId)
+
+    if action == "append":
+        message = payload.message or {}
+        role = message.get("role")
+        content = message.get("content","")
+        if role not in {"user","assistant"}:
+            return ORJSONResponse(status_code=400, content={"status":"error","message":"Invalid role"})
+        msg = append_message(session, role, content)
+        return ORJSONResponse(content={"success": True, "messageId": msg.id, "timestamp": msg.timestamp})
+
+    if action == "get-history":
+        return ORJSONResponse(content=to_history_payload(session, limit=payload.limit, offset=payload.offset or 0))
+
+    if action == "log-copy":
+        logger.info("Copy event | session=%s | messageIds=%s | type=%s | ts=%s", session.sessionId, payload.messageIds, payload.copyType, payload.timestamp)
+        return ORJSONResponse(content={"logged": True})
+
+    return ORJSONResponse(status_code=400, content={"status":"error","message":"Invalid action"})
+
+
+# -----------------------------------------------------------------------------
+# 11) API: `/api/graphic-content` (map/table/chart)
+# -----------------------------------------------------------------------------
+
+PROVIDER_TABLE_HEADERS: Tuple[Dict[str, Any], ...] = (
+    {"key":"name","label":"Provider Name","sortable": True,"editable": False},
+    {"key":"specialty","label":"Specialty","sortable": True,"editable": False},
+    {"key":"city","label":"City","sortable": True,"editable": False},
+    {"key":"state","label":"State","sortable": True,"editable": False},
+    {"key":"rating","label":"Rating","sortable": True,"editable": False},
+    {"key":"notes","label":"Notes","sortable": False,"editable": True},
+)
+
+@lru_cache(maxsize=256)
+def _provider_table_cached(provider_ids: Tuple[str, ...], page: int, page_size: int) -> Dict[str, Any]:
+    # Payloads are shared between callers: treat the returned dict as read-only.
+    start = (page-1)*page_size
+    rows = []
+    for pid in provider_ids[start:start+page_size]:
+        p = _BY_ID[pid]
+        rows.append({"id": p.id, "name": p.name, "specialty": p.specialty, "city": p.city, "state": p.state, "rating": p.rating, "notes": PROVIDER_NOTES.get(p.id, "")})
+    return {"contentType":"table","tableData":{"headers": list(PROVIDER_TABLE_HEADERS),"rows": rows,"totalRows": len(provider_ids),"page": page,"pageSize": page_size,"editableColumns":["notes"]}}
+
+def build_provider_table(providers: Sequence[Provider], page: int=1, page_size: int=25) -> Dict[str, Any]:
+    page = max(1,int(page))
+    page_size = max(1,int(page_size))
+    return _provider_table_cached(tuple(p.id for p in providers), page, page_size)
+
+def invalidate_provider_tables() -> None:
+    """Drop cached table payloads; call after any provider row is edited."""
+    _provider_table_cached.cache_clear()
+
+class GraphicContentPayload(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    action: Optional[str] = None
+    sessionId: Optional[str] = None
+    context: Optional[Dict[str, Any]] = None
+    regionId: Any = None
+    rowId: Any = None
+    columnKey: Optional[str] = None
+    newValue: Any = ""
+
+@app.post("/api/graphic-content")
+async def graphic_content_api(payload: GraphicContentPayload) -> ORJSONResponse:
+    action = payload.action
+    session = get_or_create_session(payload.sessionId)
+
+    if action == "get-content":
+        ctx = payload.context or {}
+        selected = ctx.get("selectedState") or session.selectedState
+        return ORJSONResponse(content=build_us_states_map(selected=selected))
+
+    if action == "map-click":
+        regionId = payload.regionId
+        if not regionId:
+            return ORJSONResponse(status_code=400, content={"status":"error","message":"regionId required"})
+        session.selectedState = str(regionId).upper()
+        providers = search_providers(state=session.selectedState)
+        return ORJSONResponse(content=build_provider_table(providers))
+
+    if action == "edit-cell":
+        # Ids are strings; numeric row ids are compared as text and simply don't match.
+        rowId = None if payload.rowId is None else str(payload.rowId)
+        columnKey = payload.columnKey
+        newValue = payload.newValue
+        if columnKey != "notes":
+            return ORJSONResponse(status_code=400, content={"status":"error","message":"Only 'notes' editable in MVP"})
+        updated = rowId in _BY_ID
+        if updated:
+            PROVIDER_NOTES[rowId] = str(newValue)
+            invalidate_provider_tables()
+        return ORJSONResponse(content={"success": True, "updated": updated})
+
+    if action == "chart-drill-down":
+        state = session.selectedState
+        providers = search_providers(state=state) if state else MOCK_PROVIDERS
+        counts: Dict[str,int] = {}
+        for p in providers:
+            counts[p.specialty or "Unknown"] = counts.get(p.specialty or "Unknown", 0) + 1
+        chart_data = []
+        for i,(label,value) in enumerate(sorted(counts.items(), key=lambda kv: kv[1], reverse=True)):
+            chart_data.append({"id": f"bar-{i}", "label": label, "value": value, "color":"#60a5fa", "drillDownAvailable": False})
+        return ORJSONResponse(content={"contentType":"chart","chartData":{"chartType":"bar","title": f"Providers by Specialty{(' in '+state) if state else ''}","xAxisLabel":"Specialty","yAxisLabel":"Count","data": chart_data,"interactive": True}})
+
+    return ORJSONResponse(status_code=400, content={"status":"error","message":"Invalid action"})
+
+
+# -----------------------------------------------------------------------------
+# 12) API: `/api/prompt` (multipart/form-data)
+# -----------------------------------------------------------------------------
+
+def generate_assistant_reply(session: SessionState, prompt: str, file_context: str) -> str:
+    prompt_clean = (prompt or "").strip()
+    if not prompt_clean:
+        return "Please enter a question about providers, specialties, locations, or insurance context."
+
+    guidance = "I can help with providers, specialties, locations, and (optionally) insurance/EMR context. "
+    state = session.selectedState
+    state_note = f"Current state filter: {state}. " if state else "No state selected yet. You can click a state on the map. "
+
+    specialty = None
+    low = prompt_clean.lower()
+    if "cardio" in low:
+        specialty = "Cardiology"
+    elif "endocr" in low:
+        specialty = "Endocrinology"
+    elif "primary" in low:
+        specialty = "Primary Care"
+
+    results = search_providers(state=state, specialty=specialty) if (state or specialty) else []
+    if results:
+        lines = [f"- {p.name} ({p.city}, {p.state}) — {p.specialty} (rating {p.rating})" for p in results]
+        return guidance + state_note + "Here are matching providers:\n" + "\n".join(lines)
+
+    extra = "\n\n(Uploaded file context detected; incorporate as de-identified context in V1.)" if file_context else ""
+    return guidance + state_note + f"You asked: {prompt_clean}{extra}"
+
+@app.post("/api/prompt")
+async def prompt_api(
+    prompt: str = Form(...),
+    sessionId: str = Form(None),
+    timestamp: str = Form(None),
+    files: List[UploadFile] = File(default=[])
+) -> ORJSONResponse:
+    session = get_or_create_session(sessionId)
+    append_message(session, "user", prompt)
+
+    file_texts = []
+    for f in files or []:
+        file_texts.append(await extract_text_from_upload(f))
+    file_context = "\n\n".join([t for t in file_texts if t])
+
+    assistant_text = generate_assistant_reply(session, prompt, file_context)
+    assistant_msg = append_message(session, "assistant", assistant_text)
+
+    return ORJSONResponse(content={
+        "success": True,
+        "messageId": assistant_msg.id,
+        "response": {"content": assistant_text, "contentType": "markdown"},
+        "timestamp": assistant_msg.timestamp,
+        "sessionId": session.sessionId
+    })
+
+
+# -----------------------------------------------------------------------------
+# 13) Health + minimal landing page
+# -----------------------------------------------------------------------------
+
+@app.get("/health")
+async def health() -> Dict[str, Any]:
+    # Health is used by deployment probes and by local smoke tests.
+    return {"status from the code :) ": "ok", "time": utc_iso_cached(), "tone": APP_TONE}
+
+@app.get("/")
+async def root() -> RedirectResponse:
+    # No splash page: go straight to the first UI screen.
+    return RedirectResponse(url=UI_PATH)
+
+
+# These pages never change while the server runs: render and encode them once,
+# then serve the same bytes with a validator so repeat visits get a 304.
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=3600"
+
+def _static_page(template_name: str, **context: Any) -> Tuple[bytes, str]:
+    data = TEMPLATES.get_template(template_name).render(**context).encode("utf-8")
+    return data, f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+
+def _serve_static_page(request: Request, page: Tuple[bytes, str]) -> Response:
+    data, etag = page
+    headers = {"ETag": etag, "Cache-Control": STATIC_PAGE_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match == "*" or etag in [t.strip() for t in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type="text/html; charset=utf-8", headers=headers)
+
+ABOUT_PAGE = _static_page("about.html")
+SECRET_SAUSE_PAGE = _static_page("secret_sause.html")
+PRIVACY_PAGE = _static_page("privacy.html", content=sanitize_html_allow_basic(
+    "<p><strong> Find Care Privacy Policy (MVP)</strong></p>"
+    "<p>FindCare does not store passwords. Identified PHI may be accessed only with explicit user action and is not retained by default.</p>"
+))
+
+@app.get("/about")
+async def about_page(request: Request) -> Response:
+    return _serve_static_page(request, ABOUT_PAGE)
+
+@app.get("/secret-sause")
+async def secret_sause_page(request: Request) -> Response:
+    return _serve_static_page(request, SECRET_SAUSE_PAGE)
+
+@app.get("/privacy")
+async def privacy_page(request: Request) -> Response:
+    return _serve_static_page(request, PRIVACY_PAGE)
+
+
+# -----------------------------------------------------------------------------
+# 14) Start server + open browser
+# -----------------------------------------------------------------------------
+
+READY_TIMEOUT_SEC = 5.0
+# Worker and sidecar processes import the app (and Gradio) from scratch before binding.
+SUBPROCESS_READY_TIMEOUT_SEC = 30.0
+_server_ready = threading.Event()
+
+class ReadyServer(uvicorn.Server):
+    # Sets _server_ready the moment the listening socket is bound, so the browser
+    # opens as soon as the server can answer instead of after a fixed sleep.
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started:
+            _server_ready.set()
+
+def uvicorn_accel_kwargs() -> Dict[str, Any]:
+    # uvloop/httptools ship with uvicorn[standard]; uvloop is not available on Windows,
+    # so fall back to uvicorn's defaults (asyncio loop, h11 parser) when missing.
+    kwargs: Dict[str, Any] = {}
+    try:
+        import uvloop  # noqa: F401
+        kwargs["loop"] = "uvloop"
+    except ImportError:
+        pass
+    try:
+        import httptools  # noqa: F401
+        kwargs["http"] = "httptools"
+    except ImportError:
+        pass
+    return kwargs
+
+def run_server():
+    # Log registered routes for quick debugging; the list is only built when DEBUG is on.
+    if logger.isEnabledFor(logging.DEBUG):
+        routes = []
+        for r in getattr(app, 'routes', []):
+            path = getattr(r, 'path', None)
+            methods = getattr(r, 'methods', None)
+            if path:
+                routes.append((path, sorted(list(methods)) if methods else []))
+        logger.debug("Registered routes: %s", sorted(routes))
+
+    config = uvicorn.Config(
+        app,
+        host=HOST,
+        port=PORT,
+        log_level='info',
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+        **uvicorn_accel_kwargs(),
+    )
+    ReadyServer(config).run()
+
+def _child_env() -> Dict[str, str]:
+    # Only this (parent) process writes the log file: its buffer is single-process,
+    # so workers and the sidecar log to the console they inherit instead.
+    return {**os.environ, "FINDCARE_LOG_TO_FILE": "0"}
+
+def run_server_multiworker() -> subprocess.Popen:
+    # uvicorn can only fork workers from an import string, and its supervisor needs
+    # the main thread for signal handling, so launch it as a separate process.
+    # Workers import APP_IMPORT and never reach start_backend(), so only this
+    # (parent) process opens a browser tab.
+    cmd = [
+        sys.executable, "-m", "uvicorn", APP_IMPORT,
+        "--host", HOST, "--port", str(PORT),
+        "--workers", str(WORKERS),
+        "--log-level", "info",
+        "--limit-concurrency", "1000",
+        "--timeout-keep-alive", "30",
+    ]
+    for key, value in uvicorn_accel_kwargs().items():
+        cmd += [f"--{key}", value]
+    return subprocess.Popen(cmd, cwd=APP_DIR, env=_child_env())
+
+def serve_gradio_sidecar() -> None:
+    # Body of the sidecar process: the demo alone, served under UI_PATH so proxied
+    # paths map 1:1. Only workers on this host reach it, hence 127.0.0.1.
+    sidecar = gr.mount_gradio_app(FastAPI(), demo, path=UI_PATH)
+    uvicorn.run(sidecar, host="127.0.0.1", port=GRADIO_SIDECAR_PORT, log_level="warning", **uvicorn_accel_kwargs())
+
+def run_gradio_sidecar() -> subprocess.Popen:
+    # One Gradio process shared by all API workers, which proxy UI_PATH to it.
+    # Like the workers it imports APP_IMPORT's module, so the demo (and its state)
+    # exists exactly once.
+    module = APP_IMPORT.split(":", 1)[0]
+    code = f"import {module}; {module}.serve_gradio_sidecar()"
+    return subprocess.Popen([sys.executable, "-c", code], cwd=APP_DIR, env=_child_env())
+
+def _port_in_use(host: str, port: int) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=0.25):
+            return True
+    except OSError:
+        return False
+
+def wait_for_port(host: str, port: int, timeout: float, proc: Optional[subprocess.Popen] = None) -> bool:
+    # The multi-worker server runs in another process, so readiness is observed
+    # by connecting to the port rather than through _server_ready. Gives up early
+    # if proc (the process expected to bind the port) has already exited.
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc is not None and proc.poll() is not None:
+            return False
+        if _port_in_use(host, port):
+            return True
+        time.sleep(0.05)
+    return False
+
+_server_thread = None
+_server_process = None
+_gradio_process = None
+
+def start_backend(open_path: str = UI_PATH):
+    global _server_thread, _server_process, _gradio_process
+    if (
+        (_server_thread and _server_thread.is_alive())
+        or (_server_process and _server_process.poll() is None)
+        or (_gradio_process and _gradio_process.poll() is None)
+    ):
+        print(f"Server already running on http://{HOST}:{PORT}{open_path}")
+        return
+    _server_ready.clear()
+    if WORKERS > 1:
+        # A port that already answers belongs to someone else (e.g. a leftover run);
+        # waiting on it would report that process as ready.
+        busy = [port for host, port in ((HOST, PORT), ("127.0.0.1", GRADIO_SIDECAR_PORT)) if _port_in_use(host, port)]
+        if busy:
+            print(f"Port(s) {busy} already in use; stop the process holding them and retry.")
+            return
+        _gradio_process = run_gradio_sidecar()
+        _server_process = run_server_multiworker()
+        ready_timeout = SUBPROCESS_READY_TIMEOUT_SEC
+        ready = (
+            wait_for_port("127.0.0.1", GRADIO_SIDECAR_PORT, ready_timeout, _gradio_process)
+            and wait_for_port(HOST, PORT, ready_timeout, _server_process)
+        )
+    else:
+        _server_thread = threading.Thread(target=run_server, daemon=True)
+        _server_thread.start()
+        ready_timeout = READY_TIMEOUT_SEC
+        ready = _server_ready.wait(timeout=ready_timeout)
+    url = f"http://{HOST}:{PORT}{open_path}"
+    if not ready:
+        print(f"Server not ready after {ready_timeout:.0f}s; check the log, then open manually: {url}")
+        return
+    print(f"Opening: {url}")
+    try:
+        webbrowser.open(url, new=1)
+    except Exception as e:
+        print(f"Could not open browser automatically: {e}\nOpen this URL manually: {url}")
+
+def stop_backend() -> None:
+    # Stop the worker supervisor and Gradio sidecar (uvicorn's supervisor stops its
+    # own workers on SIGTERM). Registered with atexit so neither outlives this process.
+    for proc in (_server_process, _gradio_process):
+        if proc is None or proc.poll() is not None:
+            continue
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+atexit.register(stop_backend)
+
+# `python findcare_app.py` starts at the Gradio UI mount point so /health stays reachable.
+# Guarded so uvicorn workers importing this module don't start servers/tabs.
+if __name__ == "__main__":
+    start_backend(open_path=UI_PATH)
+    # start_backend() returns once the server is up (it stays non-blocking for the
+    # notebook); as a script, keep serving until the server exits or Ctrl+C. SIGTERM
+    # becomes a normal exit so the atexit cleanup still runs.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        if _server_process is not None:
+            _server_process.wait()
+        elif _server_thread is not None:
+            _server_thread.join()
+    except KeyboardInterrupt:
+        pass
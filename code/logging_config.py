@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import logging
 import os
 import sys
@@ -9,12 +10,22 @@ from typing import Optional
 _DEFAULT_LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "logs"))
 _DEFAULT_LOG_PATH = os.path.join(_DEFAULT_LOG_DIR, "findcare.log")
 _CONFIGURED = False
+_LOG_BUFFER_SIZE = 64 * 1024
 
 
 class _TeeStream:
+    """
+    Writes go to every stream; everything else (encoding, fileno, isatty, buffer,
+    ...) is answered by the first (console) stream, so code that treats
+    sys.stdout/sys.stderr as real files (uvicorn, faulthandler) keeps working.
+    """
+
     def __init__(self, *streams):
         self._streams = streams
 
+    def __getattr__(self, name: str):
+        return getattr(self._streams[0], name)
+
     def write(self, message: str) -> None:
         for stream in self._streams:
             try:
@@ -22,6 +33,10 @@ class _TeeStream:
             except Exception:
                 pass
 
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
     def flush(self) -> None:
         for stream in self._streams:
             try:
@@ -30,19 +45,68 @@ class _TeeStream:
                 pass
 
 
-def configure_logging(name: str = "findcare", log_path: Optional[str] = None) -> logging.Logger:
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that does not flush after every record. The file buffer drains
+    when full, on WARNING and above, and via logging.shutdown() at exit.
+
+    Single-process only: a drain can end mid-line, so several processes appending
+    to the same file interleave torn lines. Use configure_logging(buffered=False)
+    when the file is shared.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def configure_logging(
+    name: str = "findcare",
+    log_path: Optional[str] = None,
+    *,
+    buffered: bool = True,
+    to_file: Optional[bool] = None,
+) -> logging.Logger:
     """
     Configure logging to file + console and tee stdout/stderr to the file.
     Safe to call multiple times.
+
+    buffered=True batches file writes in a 64 KB buffer and assumes this process
+    is the file's only writer. buffered=False flushes every record (FileHandler),
+    which keeps whole lines when several processes append to the same file.
+
+    to_file=False logs to the console only and leaves stdout/stderr alone; it
+    defaults to False when FINDCARE_LOG_TO_FILE=0 (set for worker/sidecar processes).
     """
     global _CONFIGURED
     if _CONFIGURED:
         return logging.getLogger(name)
 
+    if to_file is None:
+        to_file = os.getenv("FINDCARE_LOG_TO_FILE", "1") != "0"
+    if not to_file:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
+        _CONFIGURED = True
+        return logging.getLogger(name)
+
     effective_path = log_path or os.getenv("FINDCARE_LOG_PATH", _DEFAULT_LOG_PATH)
     os.makedirs(os.path.dirname(effective_path), exist_ok=True)
 
-    file_handler = logging.FileHandler(effective_path, encoding="utf-8")
+    if buffered:
+        # One 64 KB buffer shared by log records and the stdout/stderr tee, instead of
+        # FileHandler's flush (and syscall) per record.
+        log_file = io.TextIOWrapper(
+            io.BufferedWriter(io.FileIO(effective_path, "a"), buffer_size=_LOG_BUFFER_SIZE),
+            encoding="utf-8",
+        )
+        file_handler = _BufferedStreamHandler(log_file)
+    else:
+        file_handler = logging.FileHandler(effective_path, encoding="utf-8")
+        log_file = file_handler.stream
     stream_handler = logging.StreamHandler()
     logging.basicConfig(
         level=logging.INFO,
@@ -51,8 +115,8 @@ def configure_logging(name: str = "findcare", log_path: Optional[str] = None) ->
     )
 
     # Route stdout/stderr to the log while preserving console output.
-    sys.stdout = _TeeStream(sys.stdout, file_handler.stream)
-    sys.stderr = _TeeStream(sys.stderr, file_handler.stream)
+    sys.stdout = _TeeStream(sys.stdout, log_file)
+    sys.stderr = _TeeStream(sys.stderr, log_file)
 
     _CONFIGURED = True
     return logging.getLogger(name)